@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# scripts/bench_shared_tree.py
+"""
+Extraction benchmark for a DAG-shaped app: one sub-app mounted under many parents.
+
+```bash
+python scripts/bench_shared_tree.py                 # 60 services, 5 runs per case
+python scripts/bench_shared_tree.py --services 120 --runs 9
+```
+
+Builds a `status` sub-app of 20 groups x 10 commands (221 nodes) and mounts it under
+every service, once as a Typer app (add_typer rebuilds the Click objects per mount)
+and once as plain Click (the same objects are added to every service).
+Reports the median time of build_help_data and build_help_tree for each.
+Run it on two checkouts to compare.
+"""
+from __future__ import annotations
+import argparse
+import statistics
+import sys
+import time
+from enum import Enum
+
+import click
+import typer
+from rich.tree import Tree
+
+from typer_helptree.helptree import build_help_data, build_help_tree
+
+GROUPS = 20
+COMMANDS = 10
+
+class Format(str, Enum):
+    text = "text"
+    json = "json"
+
+def build_typer_app(services: int) -> click.Command:
+    status = typer.Typer(help="Shared status tools.")
+    for g in range(GROUPS):
+        group = typer.Typer(help=f"Status group {g}.")
+        for c in range(COMMANDS):
+            def command(
+                    target: str = typer.Argument(..., help="Target name."),
+                    verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output."),
+                    fmt: Format = typer.Option(Format.text, "--format", help="Output format."),
+                    retries: int = typer.Option(3, "--retries", envvar="STATUS_RETRIES", help="Retry count."),
+                    ):
+                """Status command."""
+            group.command(name=f"cmd{c}")(command)
+        status.add_typer(group, name=f"group{g}")
+
+    app = typer.Typer(help="Benchmark app.")
+    for s in range(services):
+        service = typer.Typer(help=f"Service {s}.")
+        service.add_typer(status, name="status")
+        app.add_typer(service, name=f"svc{s}")
+    return typer.main.get_command(app)
+
+def build_click_app(services: int) -> click.Command:
+    status = click.Group("status", help="Shared status tools.")
+    for g in range(GROUPS):
+        group = click.Group(f"group{g}", help=f"Status group {g}.")
+        for c in range(COMMANDS):
+            @group.command(name=f"cmd{c}")
+            @click.argument("target")
+            @click.option("--verbose", "-v", is_flag=True, help="Verbose output.")
+            @click.option("--format", "fmt", type=click.Choice(["text", "json"]), default="text", help="Output format.")
+            @click.option("--retries", type=int, default=3, envvar="STATUS_RETRIES", help="Retry count.")
+            def command(target, verbose, fmt, retries):
+                """Status command."""
+        status.add_command(group)
+
+    root = click.Group("bench", help="Benchmark app.")
+    for s in range(services):
+        service = click.Group(f"svc{s}", help=f"Service {s}.")
+        service.add_command(status)
+        root.add_command(service)
+    return root
+
+def time_ms(func, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--services", type=int, default=60)
+    parser.add_argument("--runs", type=int, default=5)
+    options = parser.parse_args()
+
+    print(f"{'case':<28}{'median ms':>10}")
+    for label, builder in (("typer", build_typer_app), ("click", build_click_app)):
+        root = builder(options.services)
+        ctx = click.Context(root)
+        data_ms = time_ms(lambda: build_help_data(root, ctx), options.runs)
+        tree_ms = time_ms(lambda: build_help_tree(root, Tree(label), ctx), options.runs)
+        print(f"{label + ' build_help_data':<28}{data_ms:>10.1f}")
+        print(f"{label + ' build_help_tree':<28}{tree_ms:>10.1f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# scripts/bench_startup.py
+"""
+Startup-time benchmark for the typer-helptree CLI itself.
+
+```bash
+python scripts/bench_startup.py            # 20 runs per case
+python scripts/bench_startup.py --runs 50
+```
+
+Each case runs in a fresh interpreter, the way a shell invokes the console script.
+Reports the median wall time and whether Rich was imported along the way.
+Run it on two checkouts to compare.
+"""
+from __future__ import annotations
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# label -> CLI arguments
+CASES = {
+    "--version": ["--version"],
+    "helptree --help": ["helptree", "--help"],
+    "helptree": ["helptree"],
+    "tools nested-tool": ["tools", "nested-tool"],
+    "docs (no flags)": ["docs"],
+}
+
+RUNNER = (
+    "import sys, atexit\n"
+    "atexit.register(lambda: sys.__stderr__.write('RICH=%d\\n' % any(m == 'rich' or m.startswith('rich.') for m in sys.modules)))\n"
+    "sys.argv = ['typer-helptree'] + sys.argv[1:]\n"
+    "from typer_helptree.cli import app\n"
+    "app()\n"
+)
+
+def time_case(args, runs: int):
+    samples = []
+    rich_imported = False
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, "-c", RUNNER, *args], capture_output=True, text=True)
+        samples.append(time.perf_counter() - start)
+        rich_imported = "RICH=1" in result.stderr
+    return statistics.median(samples) * 1000, rich_imported
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=20)
+    options = parser.parse_args()
+
+    start = time.perf_counter()
+    for _ in range(options.runs):
+        subprocess.run([sys.executable, "-c", "pass"], capture_output=True)
+    baseline_ms = (time.perf_counter() - start) / options.runs * 1000
+
+    print(f"{'case':<22}{'median ms':>10}  rich")
+    print(f"{'(bare interpreter)':<22}{baseline_ms:>10.1f}")
+    for label, args in CASES.items():
+        median_ms, rich_imported = time_case(args, options.runs)
+        print(f"{label:<22}{median_ms:>10.1f}  {'yes' if rich_imported else 'no'}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
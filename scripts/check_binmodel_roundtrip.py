@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# scripts/check_binmodel_roundtrip.py
+"""
+Round-trip check for the binary help model.
+
+```bash
+python scripts/check_binmodel_roundtrip.py
+```
+
+Builds a small Click app with one group mounted under several parents, then converts
+both the plain JSON export and the `--json-refs` form to binary and back. Each must
+reproduce the expanded model, and lookups must work at every mount point.
+Exits non-zero on the first mismatch.
+"""
+from __future__ import annotations
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+import click
+
+from typer_helptree.binmodel import HelpModelReader, convert_bin_to_json, convert_json_to_bin
+from typer_helptree.helptree import build_help_data, dedupe_help_data
+
+MOUNTS = 3
+
+def build_app() -> click.Group:
+    status = click.Group("status", help="Shared status group.")
+
+    @status.command()
+    @click.option("--verbose", "-v", is_flag=True, help="Verbose output.")
+    @click.option("--format", type=click.Choice(["text", "json"]), default="text")
+    def show(verbose, format):
+        """Show status."""
+
+    root = click.Group("roundtrip", help="Round-trip fixture.")
+    for i in range(MOUNTS):
+        svc = click.Group(f"svc{i}", help=f"Service {i}.")
+        svc.add_command(status)
+        root.add_command(svc)
+    return root
+
+def check(label: str, data: dict, expected: dict, workdir: Path) -> bool:
+    json_path = workdir / f"{label}.json"
+    bin_path = workdir / f"{label}.htb"
+    back_path = workdir / f"{label}_back.json"
+    json_path.write_text(json.dumps(data), encoding="utf-8")
+
+    convert_json_to_bin(json_path, bin_path)
+    convert_bin_to_json(bin_path, back_path)
+    if json.loads(back_path.read_text(encoding="utf-8")) != expected:
+        print(f"{label}: JSON -> binary -> JSON does not reproduce the expanded model")
+        return False
+
+    with HelpModelReader(bin_path) as reader:
+        for i in range(MOUNTS):
+            params = reader.get_parameters(f"svc{i}.status.show")
+            if [p["name"] for p in params or []] != ["verbose", "format"]:
+                print(f"{label}: svc{i}.status.show parameters not found")
+                return False
+
+    print(f"{label}: ok")
+    return True
+
+def main() -> int:
+    root = build_app()
+    data = build_help_data(root, click.Context(root), version="1.0")
+    expected = json.loads(json.dumps(data))
+    # dedupe_help_data matches repeats by object identity, so it runs on the shared model
+    refs = json.loads(json.dumps(dedupe_help_data(data)))
+    if "$ref" not in json.dumps(refs):
+        print("json-refs: fixture produced no $ref nodes")
+        return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        ok = check("plain", expected, expected, workdir)
+        ok = check("json-refs", refs, expected, workdir) and ok
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
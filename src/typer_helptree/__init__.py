@@ -1,7 +1,13 @@
 # __init__.py
 
-from typer_helptree.cli_helptree import add_typer_helptree
+# Resolved on first access, so `import typer_helptree.cli` (and `--version`) stays light
+def __getattr__(name):
+    if name in ("add_typer_helptree", "add_typer_helptree_serve"):
+        from typer_helptree import cli_helptree
+        return getattr(cli_helptree, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 all = [
-    "add_typer_helptree"
+    "add_typer_helptree",
+    "add_typer_helptree_serve",
 ]
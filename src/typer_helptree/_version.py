@@ -3,6 +3,7 @@
 # src/typer_helptree/_version.py
 from __future__ import annotations
 import re
+from functools import lru_cache
 from pathlib import Path
 import logging
 
@@ -11,17 +12,18 @@ logger = logging.getLogger(__name__)
 
 PACKAGE_NAME = "typer-helptree"
 
+@lru_cache(maxsize=None)
 def get_version(package_name: str) -> str:
-    # 1. Try the official way (Installed/Production)
+    # 1. Try the bundled VERSION file first (cheap; it is the source of the dynamic version)
     try:
-        from importlib.metadata import version
-        return version(package_name)
+        return (Path(__file__).parent / "VERSION").read_text(encoding="utf-8").strip()
     except Exception:
         pass
 
-    # 2. Try the dev/zip way (Local/PyZ)
+    # 2. Try the official way (Installed/Production), which scans installed distributions
     try:
-        return (Path(__file__).parent / "VERSION").read_text(encoding="utf-8").strip()
+        from importlib.metadata import version
+        return version(package_name)
     except Exception:
         return "0.0.0-unknown"
     
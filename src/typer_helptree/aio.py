@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/typer_helptree/aio.py
+"""
+Async-friendly extraction, for embedding in asyncio services.
+
+```python
+from typer_helptree.aio import build_help_data_async, iter_help_data_async
+
+data = await build_help_data_async(root_command, ctx, version="1.2.3", node_timeout=5.0)
+
+async for path, node_data in iter_help_data_async(root_command, ctx):
+    print(".".join(path), node_data["kind"])
+```
+
+Group resolution (`list_commands`/`get_command`, which may import lazily
+loaded sub-apps) runs in an executor, so the event loop is never blocked.
+The resulting model is identical to `helptree.build_help_data`.
+"""
+from __future__ import annotations
+import asyncio
+import functools
+import logging
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import click
+
+from .helptree import _build_node_data, _resolve_children, is_group
+
+logger = logging.getLogger(__name__)
+
+async def _run_in_executor(executor: Optional[Executor], timeout: Optional[float], func, *args):
+    """Runs a blocking call in an executor, bounded by an optional timeout."""
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(executor, functools.partial(func, *args))
+    # A cancelled or timed-out call stops being awaited; the worker thread itself cannot be interrupted.
+    return await asyncio.wait_for(future, timeout)
+
+async def _walk(
+        click_command: click.Command,
+        ctx: click.Context,
+        path: Tuple[str, ...],
+        version: Optional[str],
+        parent_subcommands: Optional[List[Dict[str, Any]]],
+        node_timeout: Optional[float],
+        executor: Optional[Executor],
+        ) -> AsyncIterator[Tuple[Tuple[str, ...], Dict[str, Any]]]:
+    node_data = _build_node_data(click_command, version)
+    if parent_subcommands is not None:
+        parent_subcommands.append(node_data)
+    yield path, node_data
+
+    if not is_group(click_command):
+        return
+
+    try:
+        children = await _run_in_executor(executor, node_timeout, _resolve_children, click_command, ctx)
+    except asyncio.TimeoutError:
+        logger.warning(
+            "helptree: resolving %s exceeded node_timeout=%ss",
+            ".".join(path),
+            node_timeout,
+        )
+        raise asyncio.TimeoutError(
+            f"Resolving subcommands of '{'.'.join(path)}' exceeded {node_timeout}s"
+        ) from None
+
+    # Commands first, sub-apps second (same ctx threading as build_help_data)
+    for cmd_name, cmd in children:
+        async for item in _walk(cmd, ctx, path + (cmd_name,), None, node_data["subcommands"], node_timeout, executor):
+            yield item
+
+async def iter_help_data_async(
+        click_command: click.Command,
+        ctx: click.Context,
+        version: Optional[str] = None,
+        node_timeout: Optional[float] = None,
+        executor: Optional[Executor] = None,
+        ) -> AsyncIterator[Tuple[Tuple[str, ...], Dict[str, Any]]]:
+    """
+    Yields (path, node_data) pairs depth-first, in build_help_data order, as each node becomes available.
+
+    A group's node is yielded before its subcommands are resolved; its "subcommands"
+    list then fills in as the walk continues. `node_timeout` bounds the resolution
+    of each group and raises asyncio.TimeoutError when exceeded. `executor` defaults
+    to the loop's default executor. Cancelling the consuming task stops the walk.
+    """
+    root_path = (click_command.name or "app",)
+    async for item in _walk(click_command, ctx, root_path, version, None, node_timeout, executor):
+        yield item
+
+async def build_help_data_async(
+        click_command: click.Command,
+        ctx: click.Context,
+        version: Optional[str] = None,
+        node_timeout: Optional[float] = None,
+        executor: Optional[Executor] = None,
+        ) -> Dict[str, Any]:
+    """Async equivalent of build_help_data; returns the same dictionary."""
+    root_data: Optional[Dict[str, Any]] = None
+    async for _path, node_data in iter_help_data_async(
+            click_command, ctx, version=version, node_timeout=node_timeout, executor=executor):
+        if root_data is None:
+            root_data = node_data
+    return root_data
+
+async def export_help_json_async(
+        data: Dict[str, Any],
+        app_name: str,
+        version: str,
+        output_dir: str | Path | None = None,
+        executor: Optional[Executor] = None,
+        ) -> Path:
+    """Runs io.export_help_json in an executor, keeping file I/O off the event loop."""
+    from .io import export_help_json
+    return await _run_in_executor(executor, None, export_help_json, data, app_name, version, output_dir)
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/typer_helptree/binmodel.py
+"""
+Compact binary help model, with random access by dotted command path.
+
+```bash
+yourtyperapp helptree --export-bin
+typer-helptree tools convert app_v1.0.0_tree_20260101_120000.json app.htb
+```
+
+```python
+from typer_helptree.binmodel import HelpModelReader
+
+with HelpModelReader("app.htb") as reader:
+    params = reader.get_parameters("svc-a.status.show")   # O(log n), nothing else is decoded
+```
+
+Layout (little-endian, all offsets absolute):
+    header          magic, format version, section offsets and counts
+    string table    u32 offsets (count + 1) followed by one UTF-8 blob; strings are deduplicated
+    node records    fixed size (NODE), pre-order; root is node 0
+    child ids       u32 node ids, referenced by a node's child range
+    param records   fixed size (PARAM), referenced by a node's parameter range
+    string lists    u32 string ids (opts, secondary_opts, choices)
+    path index      (path string id, node id) pairs sorted by dotted path, root path ""
+
+Values that are not plain strings (defaults, envvars, unknown keys) are stored as
+JSON text, so converting JSON -> binary -> JSON reproduces export_help_json output.
+"$ref" nodes (from `--json-refs`) are expanded before encoding, so every path is
+addressable; converting back yields the expanded model.
+"""
+from __future__ import annotations
+import copy
+import datetime
+import json
+import mmap
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .io import UniversalEncoder, error_logger, get_default_output_dir, get_friendly_path
+
+MAGIC = b"THTB"
+FORMAT_VERSION = 1
+NONE_ID = 0xFFFFFFFF
+
+HEADER = struct.Struct("<4sHxx" + "I" * 12)
+NODE = struct.Struct("<IIIIIB3xIIII")
+PARAM = struct.Struct("<" + "I" * 12 + "B3x")
+INDEX_ENTRY = struct.Struct("<II")
+U32 = struct.Struct("<I")
+
+_NODE_KEYS = ("name", "help", "kind", "is_group", "parameters", "subcommands")
+_PARAM_KEYS = ("name", "opts", "secondary_opts", "type", "required", "default", "help", "hidden", "is_flag", "envvar", "choices")
+
+_REQUIRED, _HIDDEN, _IS_FLAG = 1, 2, 4
+
+# --- Writing ---
+
+class _StringTable:
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def add(self, value: Optional[str]) -> int:
+        if value is None:
+            return NONE_ID
+        sid = self.ids.get(value)
+        if sid is None:
+            sid = self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return sid
+
+    def add_json(self, value: Any) -> int:
+        return NONE_ID if value is None else self.add(json.dumps(value, cls=UniversalEncoder))
+
+def _extras(data: Dict[str, Any], known) -> Optional[Dict[str, Any]]:
+    extra = {key: value for key, value in data.items() if key not in known}
+    return extra or None
+
+def _has_refs(node_data: Dict[str, Any]) -> bool:
+    return any("$ref" in sub_data or _has_refs(sub_data) for sub_data in (node_data.get("subcommands") or []))
+
+def encode_help_model(data: Dict[str, Any]) -> bytes:
+    """Serializes a help model (as produced by build_help_data) to the binary format."""
+    if _has_refs(data):
+        # A "$ref" node has no parameters or children of its own; encode the subtree it points to
+        from .helptree import expand_help_data_refs
+        data = expand_help_data_refs(copy.deepcopy(data))
+    strings = _StringTable()
+    node_records: List[bytes] = []
+    param_records: List[bytes] = []
+    child_ids: List[int] = []
+    string_lists: List[int] = []
+    index: List[tuple] = []
+
+    def add_list(values: Optional[List[Any]]) -> tuple:
+        if values is None:
+            return NONE_ID, 0
+        start = len(string_lists)
+        string_lists.extend(strings.add(str(value)) for value in values)
+        return start, len(values)
+
+    def add_node(node_data: Dict[str, Any], dotted_path: str) -> int:
+        node_id = len(node_records)
+        node_records.append(b"")  # reserved; filled in once the children have ids
+        index.append((dotted_path, node_id))
+
+        param_start = len(param_records)
+        for param_data in node_data.get("parameters") or []:
+            opts_start, opts_count = add_list(param_data.get("opts"))
+            sec_start, sec_count = add_list(param_data.get("secondary_opts"))
+            choices_start, choices_count = add_list(param_data.get("choices"))
+            flags = (
+                (_REQUIRED if param_data.get("required") else 0)
+                | (_HIDDEN if param_data.get("hidden") else 0)
+                | (_IS_FLAG if param_data.get("is_flag") else 0)
+            )
+            param_records.append(PARAM.pack(
+                strings.add(param_data.get("name")),
+                strings.add(param_data.get("type")),
+                strings.add(param_data.get("help")),
+                strings.add_json(param_data.get("default")),
+                strings.add_json(param_data.get("envvar")),
+                strings.add_json(_extras(param_data, _PARAM_KEYS)),
+                opts_start, opts_count,
+                sec_start, sec_count,
+                choices_start, choices_count,
+                flags,
+            ))
+        param_count = len(param_records) - param_start
+
+        child_node_ids = [
+            add_node(sub_data, f"{dotted_path}.{sub_data.get('name')}" if dotted_path else str(sub_data.get("name")))
+            for sub_data in node_data.get("subcommands") or []
+        ]
+        child_start = len(child_ids)
+        child_ids.extend(child_node_ids)
+
+        node_records[node_id] = NODE.pack(
+            strings.add(node_data.get("name")),
+            strings.add(dotted_path),
+            strings.add(node_data.get("help")),
+            strings.add(node_data.get("kind")),
+            strings.add_json(_extras(node_data, _NODE_KEYS)),
+            1 if node_data.get("is_group") else 0,
+            param_start, param_count,
+            child_start, len(child_node_ids),
+        )
+        return node_id
+
+    add_node(data, "")
+    index.sort(key=lambda entry: entry[0].encode("utf-8"))
+    index_records = [INDEX_ENTRY.pack(strings.add(path), node_id) for path, node_id in index]
+
+    encoded = [s.encode("utf-8") for s in strings.strings]
+    string_offsets = [0]
+    for blob in encoded:
+        string_offsets.append(string_offsets[-1] + len(blob))
+
+    # Section offsets
+    string_offsets_off = HEADER.size
+    string_data_off = string_offsets_off + U32.size * len(string_offsets)
+    nodes_off = string_data_off + string_offsets[-1]
+    child_ids_off = nodes_off + NODE.size * len(node_records)
+    params_off = child_ids_off + U32.size * len(child_ids)
+    string_lists_off = params_off + PARAM.size * len(param_records)
+    index_off = string_lists_off + U32.size * len(string_lists)
+
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION,
+        len(encoded), string_offsets_off, string_data_off,
+        len(node_records), nodes_off,
+        len(child_ids), child_ids_off,
+        len(param_records), params_off,
+        len(string_lists), string_lists_off,
+        index_off,
+    )
+    return b"".join([
+        header,
+        struct.pack(f"<{len(string_offsets)}I", *string_offsets),
+        *encoded,
+        *node_records,
+        struct.pack(f"<{len(child_ids)}I", *child_ids),
+        *param_records,
+        struct.pack(f"<{len(string_lists)}I", *string_lists),
+        *index_records,
+    ])
+
+# --- Reading ---
+
+class HelpModelReader:
+    """
+    Memory-mapped reader. Lookups binary-search the path index and decode only
+    the records and strings they touch.
+    """
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        (
+            magic, version,
+            self._string_count, self._string_offsets_off, self._string_data_off,
+            self.node_count, self._nodes_off,
+            _child_count, self._child_ids_off,
+            _param_count, self._params_off,
+            _string_list_count, self._string_lists_off,
+            self._index_off,
+        ) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Not a typer-helptree binary model: {self.path}")
+        if version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported binary model version {version}: {self.path}")
+
+    def close(self) -> None:
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self) -> HelpModelReader:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # --- Primitives ---
+
+    def _string_bytes(self, sid: int) -> bytes:
+        start, end = struct.unpack_from("<II", self._mm, self._string_offsets_off + U32.size * sid)
+        return self._mm[self._string_data_off + start:self._string_data_off + end]
+
+    def _string(self, sid: int) -> Optional[str]:
+        return None if sid == NONE_ID else self._string_bytes(sid).decode("utf-8")
+
+    def _json(self, sid: int) -> Any:
+        return None if sid == NONE_ID else json.loads(self._string(sid))
+
+    def _string_list(self, start: int, count: int) -> Optional[List[str]]:
+        if start == NONE_ID:
+            return None
+        sids = struct.unpack_from(f"<{count}I", self._mm, self._string_lists_off + U32.size * start)
+        return [self._string(sid) for sid in sids]
+
+    def _node_record(self, node_id: int) -> tuple:
+        return NODE.unpack_from(self._mm, self._nodes_off + NODE.size * node_id)
+
+    def _child_ids(self, child_start: int, child_count: int) -> tuple:
+        return struct.unpack_from(f"<{child_count}I", self._mm, self._child_ids_off + U32.size * child_start)
+
+    def _param(self, param_id: int) -> Dict[str, Any]:
+        (name, type_, help_, default, envvar, extra,
+         opts_start, opts_count, sec_start, sec_count, choices_start, choices_count,
+         flags) = PARAM.unpack_from(self._mm, self._params_off + PARAM.size * param_id)
+        param_data = {
+            "name": self._string(name),
+            "opts": self._string_list(opts_start, opts_count),
+            "secondary_opts": self._string_list(sec_start, sec_count),
+            "type": self._string(type_),
+            "required": bool(flags & _REQUIRED),
+            "default": self._json(default),
+            "help": self._string(help_),
+            "hidden": bool(flags & _HIDDEN),
+            "is_flag": bool(flags & _IS_FLAG),
+            "envvar": self._json(envvar),
+        }
+        if choices_start != NONE_ID:
+            param_data["choices"] = self._string_list(choices_start, choices_count)
+        param_data.update(self._json(extra) or {})
+        return param_data
+
+    # --- Lookup ---
+
+    def find(self, dotted_path: str) -> Optional[int]:
+        """Returns the node id for a dotted command path ("" for the root), or None. O(log n)."""
+        target = dotted_path.encode("utf-8")
+        lo, hi = 0, self.node_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            path_sid, node_id = INDEX_ENTRY.unpack_from(self._mm, self._index_off + INDEX_ENTRY.size * mid)
+            key = self._string_bytes(path_sid)
+            if key == target:
+                return node_id
+            if key < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def paths(self) -> Iterator[str]:
+        """Yields every dotted command path, in sorted order."""
+        for i in range(self.node_count):
+            path_sid, _node_id = INDEX_ENTRY.unpack_from(self._mm, self._index_off + INDEX_ENTRY.size * i)
+            yield self._string(path_sid)
+
+    def _node(self, node_id: int, deep: bool) -> Dict[str, Any]:
+        (name, _path, help_, kind, extra, is_group_flag,
+         param_start, param_count, child_start, child_count) = self._node_record(node_id)
+        child_node_ids = self._child_ids(child_start, child_count)
+        node_data = {
+            "name": self._string(name),
+            "help": self._string(help_),
+            "kind": self._string(kind),
+            "is_group": bool(is_group_flag),
+            "parameters": [self._param(param_start + i) for i in range(param_count)],
+            "subcommands": [
+                self._node(child_id, deep) if deep else self._string(self._node_record(child_id)[0])
+                for child_id in child_node_ids
+            ],
+        }
+        node_data.update(self._json(extra) or {})
+        return node_data
+
+    def get(self, dotted_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns one node with its parameters; "subcommands" holds child names only.
+        None if the path is unknown.
+        """
+        node_id = self.find(dotted_path)
+        return None if node_id is None else self._node(node_id, deep=False)
+
+    def get_parameters(self, dotted_path: str) -> Optional[List[Dict[str, Any]]]:
+        node_id = self.find(dotted_path)
+        if node_id is None:
+            return None
+        param_start, param_count = self._node_record(node_id)[6:8]
+        return [self._param(param_start + i) for i in range(param_count)]
+
+    def to_dict(self, dotted_path: str = "") -> Optional[Dict[str, Any]]:
+        """Decodes a full subtree (the whole model by default) back to the build_help_data form."""
+        node_id = self.find(dotted_path)
+        return None if node_id is None else self._node(node_id, deep=True)
+
+# --- Export and Conversion ---
+
+def export_help_bin(
+        data: Dict[str, Any],
+        app_name: str,
+        version: str,
+        output_dir: str | Path | None = None
+        ) -> Path:
+    """Exports the CLI structure in the compact binary format."""
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename_bin = f"{app_name}_v{version}_tree_{timestamp}.htb"
+
+    if output_dir is not None:
+        output_path = Path(output_dir) / filename_bin
+    else:
+        output_path = get_default_output_dir() / filename_bin
+
+    try:
+        output_path.write_bytes(encode_help_model(data))
+        print(f"Binary model exported: {get_friendly_path(output_path)}", file=sys.stderr)
+        return output_path
+    except Exception as e:
+        error_logger.error(f"Binary export failed: {e}", exc_info=True)
+        raise RuntimeError(f"Binary export failed: {e}")
+
+def convert_json_to_bin(json_path: str | Path, bin_path: str | Path) -> Path:
+    """Converts an export_help_json file to the binary format."""
+    with open(json_path, encoding="utf-8") as f:
+        data = json.load(f)
+    bin_path = Path(bin_path)
+    bin_path.write_bytes(encode_help_model(data))
+    return bin_path
+
+def convert_bin_to_json(bin_path: str | Path, json_path: str | Path) -> Path:
+    """Converts a binary model back to the export_help_json format."""
+    with HelpModelReader(bin_path) as reader:
+        data = reader.to_dict()
+    json_path = Path(json_path)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=4, cls=UniversalEncoder)
+    return json_path
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/typer_helptree/browse.py
+"""
+Interactive, lazily expanding help tree browser.
+
+```bash
+yourtyperapp helptree --browse
+```
+
+Only the root level is resolved at start. A group's `list_commands`/`get_command`
+are called the first time it is expanded, and the result is remembered, so the
+time to first screen does not depend on the total size of the CLI.
+
+Commands at the prompt:
+    <n>        expand/collapse node n (commands show their parameters)
+    /<text>    filter resolved nodes by name; `/` alone clears the filter
+    q          quit
+"""
+from __future__ import annotations
+import logging
+from typing import Callable, Dict, List, Optional
+
+import click
+from rich.console import Console
+from rich.markup import escape
+from rich.panel import Panel
+from rich.tree import Tree
+
+from .helptree import _format_param_label, _resolve_children, is_group, make_context
+
+logger = logging.getLogger(__name__)
+
+BROWSE_HINT = "[dim]<n> expand/collapse · /text filter · / clear filter · q quit[/dim]"
+
+class LazyNode:
+    """A command in the browser. Children are resolved on first access and then cached."""
+    __slots__ = ("name", "command", "ctx", "expanded", "_children")
+
+    def __init__(self, name: str, command: click.Command, ctx: click.Context):
+        self.name = name
+        self.command = command
+        self.ctx = ctx
+        self.expanded = False
+        self._children: Optional[List[LazyNode]] = None
+
+    @property
+    def is_group(self) -> bool:
+        return is_group(self.command)
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._children is not None
+
+    def resolved_children(self) -> List[LazyNode]:
+        """Children already resolved, without triggering resolution."""
+        return self._children or []
+
+    def children(self) -> List[LazyNode]:
+        """Resolves the subcommands once (same ordering as build_help_tree)."""
+        if self._children is None:
+            self._children = []
+            if self.is_group:
+                local_ctx = make_context(self.command, self.ctx)
+                for cmd_name, cmd in _resolve_children(self.command, local_ctx):
+                    self._children.append(LazyNode(cmd_name, cmd, make_context(cmd, local_ctx)))
+        return self._children
+
+    def label(self) -> str:
+        raw_help = self.command.help or ""
+        full_description = raw_help.splitlines()[0].strip() if raw_help else "No description available."
+        if self.is_group:
+            marker = "▾" if self.expanded else "▸"
+            return f"{marker} [bold cyan]{escape(self.name)}[/bold cyan] [dim](app)[/dim] - [dim]{escape(full_description)}[/dim]"
+        marker = "▾" if self.expanded else "·"
+        return f"{marker} [bold white]{escape(self.name)}[/bold white] - [dim]{escape(full_description)}[/dim]"
+
+class HelpTreeBrowser:
+    """
+    Prompt-driven browser over a LazyNode tree.
+    `input_func` and `console` are injectable so the browser can be scripted.
+    """
+    def __init__(
+            self,
+            root_command: click.Command,
+            ctx: click.Context,
+            app_name: str,
+            version: str = "unknown",
+            console: Optional[Console] = None,
+            input_func: Optional[Callable[[str], str]] = None,
+            ):
+        self.console = console or Console(stderr=True)
+        self.input_func = input_func or self.console.input
+        self.app_name = app_name
+        self.version = version
+        self.filter_text = ""
+        self.root = LazyNode(app_name, root_command, ctx)
+        self.root.expanded = True
+        self.root.children()  # the only eager resolution
+        self._numbered: List[LazyNode] = []
+
+    # --- Filtering ---
+
+    def _matches(self, node: LazyNode, memo: Dict[int, bool]) -> bool:
+        """True if the node or any already-resolved descendant matches the filter."""
+        key = id(node)
+        if key not in memo:
+            memo[key] = (
+                self.filter_text in node.name.lower()
+                or any(self._matches(child, memo) for child in node.resolved_children())
+            )
+        return memo[key]
+
+    # --- Rendering ---
+
+    def _add_node(self, node: LazyNode, tree_node: Tree, memo: Dict[int, bool]) -> None:
+        self._numbered.append(node)
+        branch = tree_node.add(f"[dim]{len(self._numbered)}[/dim] {node.label()}")
+        if self.filter_text:
+            # Show matches inside resolved groups, even when collapsed
+            self._add_children(node, branch, memo, node.resolved_children())
+        elif node.expanded:
+            self._add_parameters(node, branch)
+            self._add_children(node, branch, memo, node.children())
+
+    def _add_children(self, node: LazyNode, branch: Tree, memo: Dict[int, bool], children: List[LazyNode]) -> None:
+        for child in children:
+            if self.filter_text and not self._matches(child, memo):
+                continue
+            self._add_node(child, branch, memo)
+
+    def _add_parameters(self, node: LazyNode, branch: Tree) -> None:
+        visible_params = [
+            p for p in (getattr(node.command, "params", None) or [])
+            if not (hasattr(p, 'opts') and any(opt in ("-h", "--help") for opt in p.opts))
+        ]
+        if visible_params:
+            params_branch = branch.add("[yellow]Parameters[/yellow]")
+            for param in visible_params:
+                params_branch.add(_format_param_label(param))
+
+    def render(self) -> Tree:
+        """Builds the Rich tree of what is currently visible, numbering each node."""
+        self._numbered = []
+        memo: Dict[int, bool] = {}
+        title = f"[bold blue]{escape(self.app_name)}[/bold blue] (v{escape(self.version)})"
+        if self.filter_text:
+            title += f" [yellow]filter: {escape(self.filter_text)}[/yellow]"
+        app_tree = Tree(title, guide_style="cyan")
+        self._add_children(self.root, app_tree, memo, self.root.children())
+        return app_tree
+
+    # --- Interaction ---
+
+    def handle(self, command: str) -> bool:
+        """Applies one prompt command. Returns False when the browser should exit."""
+        command = command.strip()
+        if command in ("q", "quit", "exit"):
+            return False
+        if command.startswith("/"):
+            self.filter_text = command[1:].strip().lower()
+            return True
+        if command.isdigit():
+            index = int(command)
+            if 1 <= index <= len(self._numbered):
+                node = self._numbered[index - 1]
+                node.expanded = not node.expanded
+                if node.expanded:
+                    node.children()
+            return True
+        return True
+
+    def run(self) -> None:
+        while True:
+            app_tree = self.render()
+            if self.console.is_terminal:
+                self.console.clear()
+            self.console.print(Panel(app_tree, title=f"[bold]{escape(self.app_name)} CLI Help Tree[/bold]", expand=False))
+            self.console.print(BROWSE_HINT)
+            try:
+                command = self.input_func("> ")
+            except (EOFError, KeyboardInterrupt):
+                break
+            if not self.handle(command):
+                break
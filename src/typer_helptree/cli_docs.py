@@ -0,0 +1,71 @@
+#!/usr/bin/env python3 
+# SPDX-License-Identifier: MIT
+# src/typer_helptree/cli_docs.py
+"""
+The `docs` command. Loaded by cli.py only when `docs` is invoked.
+"""
+from __future__ import annotations
+import typer
+from rich.console import Console
+from typing import Optional
+from importlib.resources import files
+
+APP_DIR = "typer_helptree"
+
+console = Console()
+
+docs_app = typer.Typer(add_completion=False)
+
+@docs_app.command(name="docs", help="Show the docs for this software.")
+def docs_command(
+    license: Optional[bool] = typer.Option(
+        None, "--license", "-l", help="Show the LICENSE text."
+    ),
+    readme: Optional[bool] = typer.Option(
+        None, "--readme", "-r", help="Show the README.md content."
+    ),
+):
+    """
+    Show docs for the package.
+    """
+    if not license and not readme:
+        # If no flags are provided, show the help message for the docs subcommand.
+        # Use ctx.invoke(ctx.command.get_help, ctx) if you want to print help immediately.
+        # Otherwise, the default behavior (showing help) works fine, but we'll add a message.
+        console.print("[yellow]Please use either the --license flag and/or the --readme flag to print.[/yellow]")
+        return # Typer will automatically show the help message.
+
+    import pyhabitat
+    if pyhabitat.is_in_git_repo():
+        # Cheap when nothing changed: files are only copied when their mtime and hash differ
+        from typer_helptree.datacopy import ensure_data_files_for_build
+        ensure_data_files_for_build()
+
+    # --- Handle --license flag ---
+    if license:
+        try:
+            license_path = files(f"{APP_DIR}.data") / "LICENSE"
+            license_text = license_path.read_text(encoding="utf-8")
+            console.print(f"\n[bold green]=== LICENSE ===[/bold green]")
+            console.print(license_text, highlight=False)
+
+        except FileNotFoundError:
+            console.print("[bold red]Error:[/bold red] The embedded license file could not be found.")
+            raise typer.Exit(code=1)
+
+    # --- Handle --readme flag ---
+    if readme:
+        try:
+            readme_path = files(f"{APP_DIR}.data") / "README.md"
+            readme_text = readme_path.read_text(encoding="utf-8")
+
+            # Using rich's Panel can frame the readme text nicely
+            console.print(f"\n[bold green]=== README ===[/bold green]")
+            console.print(readme_text, highlight=False)
+
+        except FileNotFoundError:
+            console.print("[bold red]Error:[/bold red] The embedded README.md file could not be found.")
+            raise typer.Exit(code=1)
+
+    # Exit successfully if any flag was processed
+    raise typer.Exit(code=0)
@@ -15,6 +15,7 @@ subprocess.run("typer-helptree", "helptree")
 ```
 """
 from __future__ import annotations
+import sys
 import typer
 from typing import Optional, List
 from pathlib import Path
@@ -22,7 +23,7 @@ from rich.tree import Tree
 from rich.panel import Panel
 from rich.console import Console
 
-from .helptree import build_help_tree
+from .helptree import INTERNAL_COMMAND_MARKER, build_help_tree, render_help_tree
 from .utils import updating_target_file_references
 
 console_stderr = Console(stderr = True)
@@ -35,6 +36,16 @@ def add_typer_helptree(app, console, version: str = "unknown", hidden: bool =Tru
         export_json: bool = typer.Option(False, "--export-json", "-ej",help="Export to JSON."),
         export_txt: bool = typer.Option(False, "--export-txt", "-et", help="Export to TXT."),
         export_svg: bool = typer.Option(False, "--export-svg","-es", help="Export to SVG (Vector Image)."),
+        export_md: bool = typer.Option(False, "--export-md", "-em", help="Export a Markdown reference page."),
+        export_html: bool = typer.Option(False, "--export-html", "-eh", help="Export an HTML reference page."),
+        export_completion: bool = typer.Option(False, "--export-completion", "-ec", help="Export a shell-completion index and standalone resolver."),
+        export_bin: bool = typer.Option(False, "--export-bin", "-eb", help="Export a compact binary model with lookup by command path."),
+        json_refs: bool = typer.Option(False, "--json-refs", help="With --export-json, write repeated subtrees once and point to them with $ref."),
+        split: bool = typer.Option(False, "--split", help="With --export-md/--export-html, write one file per sub-app."),
+        browse: bool = typer.Option(False, "--browse", "-b", help="Browse interactively, resolving sub-apps only when expanded."),
+        isolated: bool = typer.Option(False, "--isolated", help="Extract each top-level sub-app in a worker process. Failures become error placeholders."),
+        timeout: Optional[float] = typer.Option(None, "--timeout", help="With --isolated, seconds allowed per sub-app. Defaults to 30."),
+        memory_limit: Optional[int] = typer.Option(None, "--memory-limit", help="With --isolated, address space limit per worker, in MB."),
         output_dir: Optional[Path] = typer.Option(
             None, 
             "--output-dir", "-o",
@@ -49,27 +60,82 @@ def add_typer_helptree(app, console, version: str = "unknown", hidden: bool =Tru
         # Ensure we use ctx.parent.command to get the main app's root command
         root_command = ctx.parent.command 
         app_name = root_command.name or "app"
+
+        export_flags = {
+            "--export-json": export_json,
+            "--export-txt": export_txt,
+            "--export-svg": export_svg,
+            "--export-md": export_md,
+            "--export-html": export_html,
+            "--export-completion": export_completion,
+            "--export-bin": export_bin,
+        }
+
+        if browse:
+            # Skip the full walk below; the browser resolves groups on demand
+            ignored = [flag for flag, given in export_flags.items() if given]
+            ignored += [flag for flag, given in (("--isolated", isolated), ("--path-update", update_target)) if given]
+            if ignored:
+                console_stderr.print(f"Ignoring {', '.join(ignored)}; the `--browse` flag only browses.")
+            if not sys.stdin.isatty():
+                console_stderr.print("The `--browse` flag needs an interactive terminal.")
+                raise typer.Exit(code=1)
+            from typer_helptree.browse import HelpTreeBrowser
+            HelpTreeBrowser(root_command, ctx, app_name, version, console=console_stderr).run()
+            return
         
         app_tree = Tree(f"[bold blue]{app_name}[/bold blue] (v{version})", guide_style="cyan")
         
-        # This now recurses through the root_command using your original logic
-        build_help_tree(root_command, app_tree, ctx)
+        data = None
+        if isolated:
+            from typer_helptree.isolate import DEFAULT_TIMEOUT, build_help_data_isolated
+            # Render from the isolated model; walking root_command here would undo the isolation
+            data = build_help_data_isolated(
+                root_command, ctx, version=version,
+                timeout=DEFAULT_TIMEOUT if timeout is None else timeout,
+                memory_limit_mb=memory_limit,
+            )
+            render_help_tree(data, app_tree)
+        else:
+            ignored = [flag for flag, value in (("--timeout", timeout), ("--memory-limit", memory_limit)) if value is not None]
+            if ignored:
+                console_stderr.print(f"Ignoring {', '.join(ignored)}; the `--isolated` flag is expected for this.")
+            # This now recurses through the root_command using your original logic
+            build_help_tree(root_command, app_tree, ctx)
         
         # 2. Optional Exports
         
-        if export_json:
+        if (export_json or export_md or export_html or export_completion or export_bin) and data is None:
             from typer_helptree.helptree import build_help_data
-            from typer_helptree.io import export_help_json
             data = build_help_data(root_command, ctx, version=version)
-            export_help_json(data, app_name, version, output_dir)
+
+        if export_json:
+            from typer_helptree.io import export_help_json
+            if json_refs:
+                from typer_helptree.helptree import dedupe_help_data
+                export_help_json(dedupe_help_data(data), app_name, version, output_dir)
+            else:
+                export_help_json(data, app_name, version, output_dir)
+
+        if export_md:
+            from typer_helptree.docgen import export_help_md
+            export_help_md(data, app_name, version, output_dir, split=split)
+
+        if export_html:
+            from typer_helptree.docgen import export_help_html
+            export_help_html(data, app_name, version, output_dir, split=split)
+
+        if export_completion:
+            from typer_helptree.completion import export_completion_index
+            export_completion_index(data, app_name, version, output_dir)
+
+        if export_bin:
+            from typer_helptree.binmodel import export_help_bin
+            export_help_bin(data, app_name, version, output_dir)
 
         if export_txt:
-            from typer_helptree.io import export_help_txt
-            # Capture the Rich tree as plain text using a dummy console
-            capture_console = Console(width=200, force_terminal=False, color_system=None)
-            with capture_console.capture() as capture:
-                capture_console.print(app_tree)
-            export_help_txt(capture.get(), app_name, version,output_dir)
+            from typer_helptree.io import export_help_txt, render_help_txt
+            export_help_txt(render_help_txt(app_tree), app_name, version,output_dir)
             
         # Handle SVG Export (Requires a recording console)
         if export_svg:
@@ -79,7 +145,7 @@ def add_typer_helptree(app, console, version: str = "unknown", hidden: bool =Tru
             recording_console.print(app_tree)
             export_help_svg(recording_console, app_name, version, output_dir)
             
-        if not(export_json or export_txt or export_svg):
+        if not any(export_flags.values()):
             # ONLY print if no export flags are set
             console_stderr.print(Panel(app_tree, title=f"[bold]{app_name} CLI Help Tree[/bold]", expand=False))
 
@@ -99,3 +165,24 @@ def add_typer_helptree(app, console, version: str = "unknown", hidden: bool =Tru
             else:
                # Clarify the expectation, though this is a maintenance risk. #maintenancerisk
                console_stderr.print("No targets updated; the `--output-dir` flag and the `--export-svg` flag are expected for this.") 
+
+
+def add_typer_helptree_serve(app, version: str = "unknown", hidden: bool = True):
+    @app.command(name="serve", hidden = hidden, help="Serve the help tree as JSON, TXT and SVG over local HTTP.")
+    def serve_command(
+        ctx: typer.Context,
+        host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind. Keep the loopback default unless you mean to share it."),
+        port: int = typer.Option(8765, "--port", "-P", help="Port to listen on. Use 0 for any free port."),
+    ):
+        from typer_helptree.helptree import build_help_data
+        from typer_helptree.serve import serve_help_tree
+
+        root_command = ctx.parent.command
+        app_name = root_command.name or "app"
+
+        # Build the model once; renderings are cached by the server
+        data = build_help_data(root_command, ctx, version=version)
+        serve_help_tree(data, app_name, version, host=host, port=port)
+
+    # Left out of trees and exports by marker, not by name, so a user command called "serve" still shows
+    setattr(serve_command, INTERNAL_COMMAND_MARKER, True)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3 
+# SPDX-License-Identifier: MIT
+# src/typer_helptree/cli_tools.py
+"""
+The `tools` sub-app. Loaded by cli.py only when `tools` is invoked.
+"""
+from __future__ import annotations
+import typer
+from rich.console import Console
+from pathlib import Path
+import sys
+
+console = Console()
+
+tools_app = typer.Typer(name="tools", help="Additional utility features and maintenance tools.", add_completion=False)
+
+@tools_app.command(name="nested-tool")
+def tools_nested_tool():
+    """Demo"""
+    print("This is a demo of a nested command.", file=sys.stderr)
+
+@tools_app.command(name="browse-exports")
+def tools_browse_exports():
+    """Open the system file explorer at the report output directory."""
+    from typer_helptree.io import get_export_path
+    
+    target_dir = get_export_path()
+    console.print(f"Opening: [bold cyan]{target_dir}[/bold cyan]")
+    
+    try:
+        import pyhabitat
+        pyhabitat.show_system_explorer(path = target_dir)
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(code=1)
+
+@tools_app.command(name="convert")
+def tools_convert(
+    source: Path = typer.Argument(..., help="A .json export or a .htb binary model."),
+    destination: Path = typer.Argument(..., help="Output path; the direction follows the source extension."),
+):
+    """Convert a help model between the JSON export and the binary format."""
+    from typer_helptree.binmodel import convert_json_to_bin, convert_bin_to_json
+
+    try:
+        if source.suffix.lower() == ".json":
+            output_path = convert_json_to_bin(source, destination)
+        else:
+            output_path = convert_bin_to_json(source, destination)
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        raise typer.Exit(code=1)
+    console.print(f"Converted: [bold cyan]{output_path}[/bold cyan]")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/typer_helptree/completion.py
+"""
+Compact shell-completion index, generated from the help model.
+
+```bash
+yourtyperapp helptree --export-completion
+```
+
+Writes `<app>_completion.json` (command paths, option flags and choice values)
+and `<app>_complete.py`, a copy of completion_resolver.py that answers completion
+queries from the index without importing the app.
+"""
+from __future__ import annotations
+import json
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+from .helptree import walk_help_data
+from .io import error_logger, get_default_output_dir, get_friendly_path
+
+INDEX_FORMAT_VERSION = 1
+
+def build_completion_index(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Flattens the help model into one completion node per command path (see completion_resolver.complete)."""
+    commands: Dict[str, Dict[str, Any]] = {}
+
+    for path, node_data in walk_help_data(data):
+        flags = []
+        opts: Dict[str, list] = {}
+        args = []
+        for param_data in node_data.get("parameters") or []:
+            if param_data.get("hidden"):
+                continue
+            param_opts = param_data.get("opts") or []
+            choices = param_data.get("choices")
+            if not (param_opts and param_opts[0].startswith("-")):
+                args.append(choices)
+            elif param_data.get("is_flag"):
+                flags.extend(param_opts)
+                flags.extend(param_data.get("secondary_opts") or [])
+            else:
+                for opt in param_opts:
+                    opts[opt] = choices or []
+
+        commands[" ".join(path[1:])] = {
+            "sub": [sub_data.get("name") for sub_data in (node_data.get("subcommands") or [])],
+            "flags": flags,
+            "opts": opts,
+            "args": args,
+        }
+
+    return {
+        "format": INDEX_FORMAT_VERSION,
+        "app": data.get("name") or "app",
+        "version": data.get("version"),
+        "commands": commands,
+    }
+
+def export_completion_index(
+        data: Dict[str, Any],
+        app_name: str,
+        version: str,
+        output_dir: str | Path | None = None
+        ) -> Path:
+    """Exports the completion index and its standalone resolver. Returns the index path."""
+    output_dir = Path(output_dir) if output_dir is not None else get_default_output_dir()
+    # No version or timestamp in the names: shell configuration points at a stable path
+    index_path = output_dir / f"{app_name}_completion.json"
+    resolver_path = output_dir / f"{app_name}_complete.py"
+
+    try:
+        index = build_completion_index(data)
+        with open(index_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, separators=(",", ":"))
+        shutil.copyfile(Path(__file__).with_name("completion_resolver.py"), resolver_path)
+        print(f"Completion index exported: {get_friendly_path(index_path)}", file=sys.stderr)
+        print(f"Completion resolver exported: {get_friendly_path(resolver_path)}", file=sys.stderr)
+        print(
+            f'  bash: complete -o default -C "python3 {resolver_path} {index_path}" {app_name}',
+            file=sys.stderr,
+        )
+        return index_path
+    except Exception as e:
+        error_logger.error(f"Completion export failed: {e}", exc_info=True)
+        raise RuntimeError(f"Completion export failed: {e}")
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/typer_helptree/completion_resolver.py
+"""
+Standalone shell-completion resolver. Standard library only.
+
+Answers completion queries from an index written by `helptree --export-completion`,
+without importing the app (or Typer, Click or Rich). This file is copied next to
+the index on export, so it can run from there on its own.
+
+```bash
+# query directly: the last word is the one being completed
+python3 yourtyperapp_complete.py yourtyperapp_completion.json svc-a st
+
+# bash
+complete -o default -C "python3 ~/.typer_helptree/yourtyperapp_complete.py ~/.typer_helptree/yourtyperapp_completion.json" yourtyperapp
+```
+"""
+from __future__ import annotations
+import json
+import os
+import sys
+
+# No typing import: annotations stay unevaluated strings, and every import counts at TAB time
+
+def load_index(index_path: str) -> dict:
+    with open(index_path, encoding="utf-8") as f:
+        return json.load(f)
+
+def complete(index: dict, words: list, incomplete: str, value_only: bool = False) -> list:
+    """
+    Returns the candidates for `incomplete`, given the words already typed after the program name.
+    For `--opt=val`, candidates are `--opt=value`, or just `value` with `value_only`: bash splits
+    words at "=" (COMP_WORDBREAKS) and replaces only the part after it.
+
+    Index node layout (keyed by space-joined command path, "" for the root):
+        "sub":   subcommand names
+        "flags": options that take no value
+        "opts":  options that take a value -> list of choices (empty when free-form)
+        "args":  positional arguments -> list of choices, or null
+    """
+    commands = index["commands"]
+    node_key = ""
+    expecting = None
+    positional = 0
+
+    for word in words:
+        node = commands[node_key]
+        if expecting is not None:
+            expecting = None
+            continue
+        if word.startswith("-"):
+            if "=" not in word and word in node["opts"]:
+                expecting = word
+            continue
+        if word in node["sub"]:
+            node_key = f"{node_key} {word}".strip()
+            positional = 0
+            continue
+        positional += 1
+
+    node = commands[node_key]
+
+    if expecting is not None:
+        candidates = node["opts"][expecting]
+    elif incomplete.startswith("-"):
+        if "=" in incomplete:
+            opt, _, value = incomplete.partition("=")
+            values = sorted(c for c in node["opts"].get(opt, []) if c.startswith(value))
+            return values if value_only else [f"{opt}={c}" for c in values]
+        candidates = node["flags"] + list(node["opts"])
+    else:
+        candidates = list(node["sub"])
+        args = node["args"]
+        if positional < len(args) and args[positional]:
+            candidates += args[positional]
+
+    return sorted(c for c in candidates if c.startswith(incomplete))
+
+def main(argv: list = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv:
+        print("usage: completion_resolver.py INDEX [WORD ...]", file=sys.stderr)
+        return 2
+    index = load_index(argv[0])
+
+    comp_line = os.environ.get("COMP_LINE")
+    value_only = False
+    if comp_line is not None:
+        # Invoked by bash `complete -C`: the line up to the cursor is authoritative
+        import shlex
+        comp_point = int(os.environ.get("COMP_POINT", len(comp_line)))
+        line = comp_line[:comp_point]
+        try:
+            tokens = shlex.split(line)
+        except ValueError:
+            tokens = line.split()
+        if line.endswith(" ") or not tokens:
+            tokens.append("")
+        words, incomplete = tokens[1:-1], tokens[-1]
+        # COMP_WORDBREAKS is rarely exported; bash's default includes "="
+        value_only = "=" in os.environ.get("COMP_WORDBREAKS", "=")
+    else:
+        words, incomplete = (argv[1:-1], argv[-1]) if len(argv) > 1 else ([], "")
+
+    try:
+        candidates = complete(index, words, incomplete, value_only)
+    except KeyError:
+        candidates = []
+    sys.stdout.write("".join(f"{c}\n" for c in candidates))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 # src/typer_helptree/datacopy.py
 from __future__ import annotations
+import hashlib
 import shutil
 import sys
 from pathlib import Path
@@ -14,6 +15,29 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
 APP_DIR = "typer_helptree"
 
+def _file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+def copy_if_changed(source: Path, destination: Path) -> bool:
+    """
+    Copies source to destination unless it is already up to date. Returns True if copied.
+    Matching size and mtime short-circuits; otherwise contents are compared by hash.
+    """
+    if destination.exists():
+        source_stat = source.stat()
+        destination_stat = destination.stat()
+        if source_stat.st_size == destination_stat.st_size:
+            if source_stat.st_mtime_ns == destination_stat.st_mtime_ns:
+                return False
+            if _file_digest(source) == _file_digest(destination):
+                # Same content, e.g. after a checkout touched the mtime; sync it so the next check is cheap
+                shutil.copystat(source, destination)
+                return False
+
+    destination.parent.mkdir(parents=True, exist_ok=True) # Ensure data dir exists
+    shutil.copy2(source, destination) # copy2 preserves metadata
+    return True
+
 # --- COPY LICENSE FILE TO PACKAGE DATA ---
 def ensure_package_license(source_root_path: Path, package_data_path: Path):
     """Copies the root LICENSE file into the expected package data path."""
@@ -24,9 +48,8 @@ def ensure_package_license(source_root_path: Path, package_data_path: Path):
         logger.warning(f"FATAL: Root license file not found at {source}!")
         sys.exit(1)
 
-    logger.debug(f"Ensuring package license is copied to: {destination}")
-    destination.parent.mkdir(parents=True, exist_ok=True) # Ensure data dir exists
-    shutil.copy2(source, destination) # copy2 preserves metadata
+    if copy_if_changed(source, destination):
+        logger.debug(f"Package license copied to: {destination}")
 
 # --- COPY README FILE TO PACKAGE DATA ---
 def ensure_package_readme(source_root_path: Path, package_data_path: Path):
@@ -38,9 +61,8 @@ def ensure_package_readme(source_root_path: Path, package_data_path: Path):
         logger.warning(f"FATAL: Root README file not found at {source}!")
         sys.exit(1)
 
-    logger.debug(f"Ensuring package README is copied to: {destination}")
-    destination.parent.mkdir(parents=True, exist_ok=True) # Ensure data dir exists
-    shutil.copy2(source, destination) # copy2 preserves metadata
+    if copy_if_changed(source, destination):
+        logger.debug(f"Package README copied to: {destination}")
 
 
 def ensure_data_files_for_build():
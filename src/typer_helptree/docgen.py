@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/typer_helptree/docgen.py
+"""
+Markdown and HTML reference pages, generated from the help model.
+
+```bash
+yourtyperapp helptree --export-md --export-html
+yourtyperapp helptree --export-md --split -o docs/
+```
+
+One section per command, with a parameter table, anchors and a table of contents.
+Output is written in a single streaming pass over the model: the table of contents
+goes straight to the output file while section bodies are spooled to a temporary
+file and appended at the end, so memory does not grow with the size of the app.
+With `split`, each top-level sub-app gets its own file.
+"""
+from __future__ import annotations
+import html
+import re
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .helptree import walk_help_data
+from .io import error_logger, get_default_output_dir, get_friendly_path
+
+CommandPath = Tuple[str, ...]
+
+# --- Formatting helpers ---
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-") or "app"
+
+def _anchor(path: CommandPath) -> str:
+    return "-".join(_slug(part) for part in path)
+
+class _UniqueSlugs:
+    """One slug per key; keys that slugify alike (`foo_bar`, `foo-bar`) get -2, -3, ... in order of first use."""
+    def __init__(self):
+        self._by_key: Dict[Any, str] = {}
+        self._taken = set()
+
+    def get(self, key: Any, slug: str) -> str:
+        if key not in self._by_key:
+            unique, n = slug, 2
+            while unique in self._taken:
+                unique, n = f"{slug}-{n}", n + 1
+            self._taken.add(unique)
+            self._by_key[key] = unique
+        return self._by_key[key]
+
+def _default_str(param_data: Dict[str, Any]) -> str:
+    default_value = param_data.get("default")
+    return "" if default_value is None else str(default_value)
+
+def _md_cell(text: Any) -> str:
+    """Escapes a value for a single Markdown table cell."""
+    return str(text).replace("|", "\\|").replace("\n", " ").strip()
+
+class _MarkdownFormat:
+    extension = "md"
+    label = "Markdown"
+
+    def header(self, title: str, version: str, up: Optional[Tuple[str, str]] = None) -> str:
+        up_line = f"Up: [{up[0]}]({up[1]})\n\n" if up else ""
+        return f"# {title}\n\n{up_line}Version: `{version}`\n\n## Contents\n\n"
+
+    def toc_entry(self, depth: int, name: str, href: str) -> str:
+        return f"{'  ' * depth}- [`{name}`]({href})\n"
+
+    def toc_end(self) -> str:
+        return "\n"
+
+    def section(self, path: CommandPath, anchor: str, level: int, node_data: Dict[str, Any], child_links: List[Tuple[str, str]]) -> str:
+        lines = [f'<a id="{anchor}"></a>', "", f"{'#' * level} `{' '.join(path)}`", ""]
+
+        help_text = (node_data.get("help") or "").strip()
+        kind = node_data.get("kind", "command")
+        lines.append(f"*{kind}*" + (f" — {help_text}" if help_text else ""))
+        lines.append("")
+
+        parameters = node_data.get("parameters") or []
+        if parameters:
+            lines.append("| Parameter | Flags | Type | Required | Default | Help |")
+            lines.append("|---|---|---|---|---|---|")
+            for param_data in parameters:
+                flags = ", ".join(f"`{_md_cell(opt)}`" for opt in (param_data.get("opts") or []))
+                lines.append(
+                    f"| `{_md_cell(param_data.get('name') or '')}` "
+                    f"| {flags} "
+                    f"| {_md_cell(param_data.get('type') or '')} "
+                    f"| {'yes' if param_data.get('required') else 'no'} "
+                    f"| {_md_cell(_default_str(param_data))} "
+                    f"| {_md_cell(param_data.get('help') or '')} |"
+                )
+            lines.append("")
+
+        if child_links:
+            links = ", ".join(f"[`{name}`]({href})" for name, href in child_links)
+            lines.append(f"Subcommands: {links}")
+            lines.append("")
+
+        return "\n".join(lines) + "\n"
+
+    def footer(self) -> str:
+        return ""
+
+class _HtmlFormat:
+    extension = "html"
+    label = "HTML"
+
+    def header(self, title: str, version: str, up: Optional[Tuple[str, str]] = None) -> str:
+        title = html.escape(title)
+        up_line = f'<p>Up: <a href="{html.escape(up[1])}">{html.escape(up[0])}</a></p>\n' if up else ""
+        return (
+            "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n"
+            f"<title>{title}</title>\n"
+            "<style>\n"
+            "body { font-family: sans-serif; max-width: 60rem; margin: auto; padding: 1rem; }\n"
+            "table { border-collapse: collapse; margin-bottom: 1rem; }\n"
+            "th, td { border: 1px solid #ccc; padding: 0.25rem 0.5rem; text-align: left; vertical-align: top; }\n"
+            "nav li { list-style: none; }\n"
+            "</style>\n</head>\n<body>\n"
+            f"<h1>{title}</h1>\n{up_line}<p>Version: <code>{html.escape(version)}</code></p>\n"
+            "<nav>\n<h2>Contents</h2>\n<ul>\n"
+        )
+
+    def toc_entry(self, depth: int, name: str, href: str) -> str:
+        return (
+            f'<li style="margin-left: {depth * 1.5}rem">'
+            f'<a href="{html.escape(href)}"><code>{html.escape(name)}</code></a></li>\n'
+        )
+
+    def toc_end(self) -> str:
+        return "</ul>\n</nav>\n"
+
+    def section(self, path: CommandPath, anchor: str, level: int, node_data: Dict[str, Any], child_links: List[Tuple[str, str]]) -> str:
+        parts = [f'<section id="{anchor}">\n<h{level}><code>{html.escape(" ".join(path))}</code></h{level}>\n']
+
+        help_text = (node_data.get("help") or "").strip()
+        kind = node_data.get("kind", "command")
+        parts.append(f"<p><em>{html.escape(kind)}</em>" + (f" — {html.escape(help_text)}" if help_text else "") + "</p>\n")
+
+        parameters = node_data.get("parameters") or []
+        if parameters:
+            parts.append(
+                "<table>\n<tr><th>Parameter</th><th>Flags</th><th>Type</th>"
+                "<th>Required</th><th>Default</th><th>Help</th></tr>\n"
+            )
+            for param_data in parameters:
+                flags = ", ".join(f"<code>{html.escape(opt)}</code>" for opt in (param_data.get("opts") or []))
+                parts.append(
+                    f"<tr><td><code>{html.escape(param_data.get('name') or '')}</code></td>"
+                    f"<td>{flags}</td>"
+                    f"<td>{html.escape(str(param_data.get('type') or ''))}</td>"
+                    f"<td>{'yes' if param_data.get('required') else 'no'}</td>"
+                    f"<td>{html.escape(_default_str(param_data))}</td>"
+                    f"<td>{html.escape(param_data.get('help') or '')}</td></tr>\n"
+                )
+            parts.append("</table>\n")
+
+        if child_links:
+            links = ", ".join(
+                f'<a href="{html.escape(href)}"><code>{html.escape(name)}</code></a>' for name, href in child_links
+            )
+            parts.append(f"<p>Subcommands: {links}</p>\n")
+
+        parts.append("</section>\n")
+        return "".join(parts)
+
+    def footer(self) -> str:
+        return "</body>\n</html>\n"
+
+# --- Streaming writer ---
+
+class _ReferenceFile:
+    """
+    One output document. The table of contents is streamed to the target file;
+    sections are spooled to a temporary file and appended on close.
+    """
+    def __init__(self, output_path: Path, fmt, title: str, version: str, up: Optional[Tuple[str, str]] = None):
+        self.output_path = output_path
+        self.fmt = fmt
+        self._out = open(output_path, "w", encoding="utf-8")
+        self._body = tempfile.TemporaryFile(mode="w+", encoding="utf-8")
+        self._out.write(fmt.header(title, version, up))
+
+    def add_toc_entry(self, depth: int, name: str, href: str) -> None:
+        self._out.write(self.fmt.toc_entry(depth, name, href))
+
+    def add_section(self, text: str) -> None:
+        self._body.write(text)
+
+    def close(self) -> None:
+        try:
+            self._out.write(self.fmt.toc_end())
+            self._body.seek(0)
+            shutil.copyfileobj(self._body, self._out)
+            self._out.write(self.fmt.footer())
+        finally:
+            self._body.close()
+            self._out.close()
+
+def _export_reference(
+        data: Dict[str, Any],
+        fmt,
+        app_name: str,
+        version: str,
+        output_dir: str | Path | None = None,
+        split: bool = False
+        ) -> Path:
+    output_dir = Path(output_dir) if output_dir is not None else get_default_output_dir()
+    stem = f"{app_name}_v{version}_reference"
+    root_filename = f"{stem}.{fmt.extension}"
+
+    # Top-level sub-apps are known from the root node alone; no extra pass needed
+    split_names = {
+        sub_data.get("name") for sub_data in (data.get("subcommands") or []) if sub_data.get("is_group")
+    } if split else set()
+
+    file_slugs = _UniqueSlugs()
+    anchors = _UniqueSlugs()
+
+    def filename_for(path: CommandPath) -> str:
+        if len(path) >= 2 and path[1] in split_names:
+            return f"{stem}_{file_slugs.get(path[1], _slug(path[1]))}.{fmt.extension}"
+        return root_filename
+
+    def anchor_for(path: CommandPath) -> str:
+        return anchors.get(path, _anchor(path))
+
+    def href_for(from_path: CommandPath, to_path: CommandPath) -> str:
+        target = filename_for(to_path)
+        prefix = "" if target == filename_for(from_path) else target
+        return f"{prefix}#{anchor_for(to_path)}"
+
+    root_doc: Optional[_ReferenceFile] = None
+    sub_doc: Optional[_ReferenceFile] = None
+    written: List[Path] = []
+
+    root_title = f"{app_name} CLI Reference"
+
+    try:
+        root_doc = _ReferenceFile(output_dir / root_filename, fmt, root_title, version)
+        written.append(root_doc.output_path)
+
+        for path, node_data in walk_help_data(data):
+            filename = filename_for(path)
+
+            if filename == root_filename:
+                doc = root_doc
+            else:
+                if sub_doc is None or sub_doc.output_path.name != filename:
+                    # Depth-first order keeps each sub-app contiguous: at most one extra file is open
+                    if sub_doc is not None:
+                        sub_doc.close()
+                    sub_doc = _ReferenceFile(
+                        output_dir / filename, fmt, f"{app_name} {path[1]} CLI Reference", version,
+                        up=(root_title, root_filename),
+                    )
+                    written.append(sub_doc.output_path)
+                    # Link the sub-app file from the root table of contents
+                    root_doc.add_toc_entry(1, path[1], href_for(path[:1], path))
+                doc = sub_doc
+
+            # Nesting depth within this document
+            depth = len(path) - 1 if doc is root_doc else len(path) - 2
+            doc.add_toc_entry(depth, " ".join(path[1:]) or path[0], f"#{anchor_for(path)}")
+
+            child_links = [
+                (sub_data.get("name"), href_for(path, path + (sub_data.get("name"),)))
+                for sub_data in (node_data.get("subcommands") or [])
+            ]
+            doc.add_section(fmt.section(path, anchor_for(path), min(depth + 2, 6), node_data, child_links))
+    except Exception as e:
+        error_logger.error(f"{fmt.label} export failed: {e}", exc_info=True)
+        raise RuntimeError(f"{fmt.label} export failed: {e}")
+    finally:
+        if sub_doc is not None:
+            sub_doc.close()
+        if root_doc is not None:
+            root_doc.close()
+
+    for output_path in written:
+        print(f"{fmt.label} reference exported: {get_friendly_path(output_path)}", file=sys.stderr)
+    return output_dir / root_filename
+
+# --- Export Functionality ---
+
+def export_help_md(
+        data: Dict[str, Any],
+        app_name: str,
+        version: str,
+        output_dir: str | Path | None = None,
+        split: bool = False
+        ) -> Path:
+    """Exports a Markdown reference page. With split=True, one file per top-level sub-app. Returns the index file."""
+    return _export_reference(data, _MarkdownFormat(), app_name, version, output_dir, split)
+
+def export_help_html(
+        data: Dict[str, Any],
+        app_name: str,
+        version: str,
+        output_dir: str | Path | None = None,
+        split: bool = False
+        ) -> Path:
+    """Exports an HTML reference page. With split=True, one file per top-level sub-app. Returns the index file."""
+    return _export_reference(data, _HtmlFormat(), app_name, version, output_dir, split)
@@ -4,7 +4,8 @@
 from __future__ import annotations
 import click
 from rich.tree import Tree
-from typing import Dict, Any, List
+from typer.core import TyperCommand, TyperGroup
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from enum import Enum
 import logging
 #if not logging.getLogger().handlers:
@@ -12,6 +13,13 @@ import logging
 logger = logging.getLogger(__name__)
 #logger.setLevel(logging.DEBUG)
 
+# Set on the callback of typer-helptree's own `serve` command (see add_typer_helptree_serve).
+# A user command that happens to be called "serve" is not marked and stays in the tree.
+INTERNAL_COMMAND_MARKER = "_typer_helptree_internal"
+
+# click>=8.3 marks "no default" with a sentinel; older click has none
+_CLICK_UNSET = getattr(click.core, "UNSET", None)
+
 def _get_param_data_(param: click.Parameter) -> Dict[str, Any]:
     """
     Extracts raw metadata from a Click parameter for JSON export.
@@ -29,12 +37,15 @@ def _get_param_data(param: click.Parameter) -> Dict[str, Any]:
 
     # Handle the default value safely
     default_val = param.default
-    if isinstance(default_val, Enum):
+    if _CLICK_UNSET is not None and default_val is _CLICK_UNSET:
+        # Checked before Enum: the sentinel is an Enum member whose value is a bare object()
+        default_val = None
+    elif isinstance(default_val, Enum):
         default_val = default_val.value
     elif default_val is not None and not isinstance(default_val, (str, int, float, bool, list, dict)):
         default_val = str(default_val)
 
-    return {
+    param_data = {
         "name": param.name,
         "opts": param.opts,
         "secondary_opts": param.secondary_opts,
@@ -47,6 +58,13 @@ def _get_param_data(param: click.Parameter) -> Dict[str, Any]:
         "envvar": param.envvar,
     }
 
+    # click.Choice, or typer's vendored equivalent: duck-typed, like is_group()
+    choices = getattr(param.type, "choices", None)
+    if choices is not None:
+        param_data["choices"] = [c.value if isinstance(c, Enum) else str(c) for c in choices]
+
+    return param_data
+
 def _format_param_label(param: click.Parameter) -> str:
     """
     Formats a Click parameter into a colorized string for the Rich tree.
@@ -68,6 +86,27 @@ def _format_param_label(param: click.Parameter) -> str:
     arg_name = param.human_readable_name.upper()
     return f"[magenta]ARG: {arg_name}[/magenta]: [dim]{param.help or ''}[/dim]"
 
+def _format_param_data_label(param_data: Dict[str, Any]) -> str:
+    """
+    Formats an extracted parameter dict (see _get_param_data) for the Rich tree.
+    Mirrors _format_param_label, for rendering from the help model instead of Click objects.
+    """
+    opts = param_data.get("opts") or []
+    help_text = param_data.get("help") or ""
+
+    if opts and opts[0].startswith('-'):
+        flag_names = " / ".join(opts)
+        default_value = param_data.get("default")
+
+        default_str = ""
+        if default_value is not None:
+            default_str = f" [dim](default: {default_value})[/dim]"
+
+        return f"[green]{flag_names}[/green]: [dim]{help_text}[/dim]{default_str}"
+
+    arg_name = (param_data.get("name") or "").upper()
+    return f"[magenta]ARG: {arg_name}[/magenta]: [dim]{help_text}[/dim]"
+
 def _add_parameters_to_node(click_command: click.Command, tree_node: Tree) -> None:
     """Extracts parameters and appends them to the Rich tree node."""
     if not hasattr(click_command, 'params') or not click_command.params:
@@ -83,8 +122,119 @@ def _add_parameters_to_node(click_command: click.Command, tree_node: Tree) -> No
         for param in visible_params:
             params_branch.add(_format_param_label(param))
 
-def build_help_tree(click_command: click.Command, tree_node: Tree, ctx: click.Context) -> None:
-    """Builds the Rich Tree structure recursively."""
+# list_commands implementations that only read the group's `commands` dict
+_STATIC_LIST_COMMANDS = frozenset({"Group.list_commands", "TyperGroup.list_commands"})
+
+def _param_key(param: click.Parameter) -> Tuple:
+    """Every parameter attribute that _get_param_data and _format_param_label read."""
+    envvar = param.envvar
+    choices = getattr(param.type, "choices", None)
+    return (
+        param.name,
+        tuple(param.opts),
+        tuple(param.secondary_opts),
+        str(param.type),
+        None if choices is None else tuple(c.value if isinstance(c, Enum) else str(c) for c in choices),
+        param.required,
+        repr(param.default),
+        param.help,
+        getattr(param, "hidden", False),
+        getattr(param, "is_flag", False),
+        tuple(envvar) if isinstance(envvar, (list, tuple)) else envvar,
+    )
+
+class _MemoKeys:
+    """
+    Memo keys for one walk. Each command object is keyed once (by id; the command is kept so
+    its id cannot be reused), and each distinct structure is interned to a small int, so a
+    group's key holds its children's ints instead of their nested structures.
+    """
+    def __init__(self):
+        self.by_id: Dict[int, Tuple[click.Command, Any]] = {}
+        self.tokens: Dict[Tuple, int] = {}
+
+def _memo_key(cmd: click.Command, keys: _MemoKeys) -> Any:
+    """
+    Memo key shared by every mount of one command definition.
+    Typer's add_typer rebuilds the Click objects at each mount, so commands are matched by
+    structure: the user callback (kept by Typer as __wrapped__), name, help, short help,
+    everything the model records per parameter and, for groups, the keys of their registered
+    subcommands. Only attributes are read; nothing is resolved. Groups with their own
+    list_commands fall back to object identity.
+
+    Typer derives a command's parameters from its callback's signature alone, so for Typer
+    classes the callback stands in for the per-parameter fields; keying every rebuilt
+    parameter would cost about as much as extracting it.
+    """
+    cached = keys.by_id.get(id(cmd))
+    if cached is not None:
+        return cached[1]
+
+    # Placeholder while the subtree is keyed: a group that contains itself ends the recursion here
+    identity_key = ("id", id(cmd))
+    keys.by_id[id(cmd)] = (cmd, identity_key)
+
+    commands = getattr(cmd, "commands", None)
+    if is_group(cmd) and (
+            type(cmd).list_commands.__qualname__ not in _STATIC_LIST_COMMANDS or not isinstance(commands, dict)):
+        return identity_key
+
+    callback = getattr(cmd, "callback", None)
+    params = getattr(cmd, "params", ())
+    if callback is not None and isinstance(cmd, (TyperCommand, TyperGroup)):
+        params_key = tuple(param.name for param in params)
+    else:
+        params_key = tuple(_param_key(param) for param in params)
+    structure = (
+        type(cmd),
+        cmd.name,
+        getattr(cmd, "help", None),
+        getattr(cmd, "short_help", None),
+        getattr(cmd, "deprecated", False),
+        getattr(callback, "__wrapped__", callback),
+        params_key,
+    )
+    if is_group(cmd):
+        structure += (tuple((name, _memo_key(sub, keys)) for name, sub in sorted(commands.items())),)
+    key = keys.tokens.setdefault(structure, len(keys.tokens))
+    keys.by_id[id(cmd)] = (cmd, key)
+    return key
+
+def _share_memoized_branch(
+        cmd: click.Command,
+        sub_node: Tree,
+        memo: Dict[Any, Tuple[click.Command, Tree]],
+        keys: _MemoKeys
+        ) -> bool:
+    """
+    If cmd was already built elsewhere in this walk, reuses its branches under sub_node and returns True.
+    Otherwise records sub_node as the place cmd is built.
+    """
+    key = _memo_key(cmd, keys)
+    cached = memo.get(key)
+    if cached is not None:
+        sub_node.children = cached[1].children
+        return True
+    memo[key] = (cmd, sub_node)
+    return False
+
+def build_help_tree(
+        click_command: click.Command,
+        tree_node: Tree,
+        ctx: click.Context,
+        _memo: Optional[Dict[Any, Tuple[click.Command, Tree]]] = None,
+        _keys: Optional[_MemoKeys] = None
+        ) -> None:
+    """
+    Builds the Rich Tree structure recursively.
+    A command mounted under several parents is built once; later mounts share its branches (see _memo_key).
+    """
+    if _memo is None:
+        _memo = {}
+    if _keys is None:
+        _keys = _MemoKeys()
+    # Recorded before recursing, so a mount of the root further down shares its branches
+    _memo.setdefault(_memo_key(click_command, _keys), (click_command, tree_node))
     _add_parameters_to_node(click_command, tree_node)
 
     logger.debug(
@@ -136,9 +286,9 @@ def build_help_tree(click_command: click.Command, tree_node: Tree, ctx: click.Co
                 )
                 continue
 
-            if cmd.name == "helptree":
+            if is_internal_command(cmd):
                 logger.debug(
-                    "helptree: skipping internal helptree command"
+                    "helptree: skipping internal %s command", cmd.name
                 )
                 continue
             # ---
@@ -160,10 +310,12 @@ def build_help_tree(click_command: click.Command, tree_node: Tree, ctx: click.Co
             sub_node = tree_node.add(
                 f"[bold white]{cmd_name}[/bold white] - [dim]{full_description}[/dim]"
             )
+            if _share_memoized_branch(cmd, sub_node, _memo, _keys):
+                continue
             #md_ctx = click.Context(cmd)
             cmd_ctx = make_context(cmd, local_ctx)
     
-            build_help_tree(cmd, sub_node, cmd_ctx)
+            build_help_tree(cmd, sub_node, cmd_ctx, _memo, _keys)
 
         # Render sub-apps second
         for cmd_name in group_names:
@@ -174,10 +326,12 @@ def build_help_tree(click_command: click.Command, tree_node: Tree, ctx: click.Co
             sub_node = tree_node.add(
                 f"[bold cyan]{cmd_name}[/bold cyan] [dim](app)[/dim] - [dim]{full_description}[/dim]"
             )
+            if _share_memoized_branch(cmd, sub_node, _memo, _keys):
+                continue
             #cmd_ctx = click.Context(cmd)
             cmd_ctx = make_context(cmd, local_ctx)
 
-            build_help_tree(cmd, sub_node, cmd_ctx)
+            build_help_tree(cmd, sub_node, cmd_ctx, _memo, _keys)
 
         logger.debug(
             "Contexts: parent_ctx=%s local_ctx=%s",
@@ -189,8 +343,8 @@ def build_help_tree(click_command: click.Command, tree_node: Tree, ctx: click.Co
         click_command.name,
     )
 
-def build_help_data(click_command: click.Command, ctx: click.Context, version: str = None) -> Dict[str, Any]:
-    """Recursively builds a dictionary for JSON export, utilizing _get_param_data."""
+def _build_node_data(click_command: click.Command, version: str = None) -> Dict[str, Any]:
+    """Builds one node of the help model, without resolving any subcommands."""
 
     is_group_cmd = is_group(click_command)
 
@@ -221,67 +375,177 @@ def build_help_data(click_command: click.Command, ctx: click.Context, version: s
             # Logic restored: uses the helper function
             node_data["parameters"].append(_get_param_data(param))
 
-    if is_group(click_command):
-        command_names: list[str] = []
-        group_names: list[str] = []
-
-        command_names_raw = click_command.list_commands(ctx)
+    return node_data
 
-        logger.debug(
-            "helptree: command=%s list_commands=%s",
-            click_command.name,
-            command_names_raw,
-        )
-        for cmd_name in command_names_raw:
-            
+def _resolve_children(click_command: click.Command, ctx: click.Context) -> List[Tuple[str, click.Command]]:
+    """
+    Resolves the subcommands of a group as (name, command) pairs.
+    Stable ordering: commands first, sub-apps second, each sorted by name.
+    Each child is resolved with get_command exactly once.
+    """
+    commands: list[tuple[str, click.Command]] = []
+    groups: list[tuple[str, click.Command]] = []
 
-            cmd = click_command.get_command(ctx, cmd_name)
-            # ---
-            #if not cmd or cmd.name == "helptree":
-            #    continue
-            
-            if cmd is None:
-                logger.warning(
-                    "helptree: get_command(%s) returned None under %s",
-                    cmd_name,
-                    click_command.name,
-                )
-                continue
+    command_names_raw = click_command.list_commands(ctx)
 
-            if cmd.name == "helptree":
-                logger.debug(
-                    "helptree: skipping internal helptree command"
-                )
-                continue
-            # ---
-            if is_group(cmd):
-                group_names.append(cmd_name)
-            else:
-                command_names.append(cmd_name)
+    logger.debug(
+        "helptree: command=%s list_commands=%s",
+        click_command.name,
+        command_names_raw,
+    )
+    for cmd_name in command_names_raw:
+        cmd = click_command.get_command(ctx, cmd_name)
 
-        # Stable ordering
-        command_names.sort()
-        group_names.sort()
+        if cmd is None:
+            logger.warning(
+                "helptree: get_command(%s) returned None under %s",
+                cmd_name,
+                click_command.name,
+            )
+            continue
 
-        # Commands first
-        for cmd_name in command_names:
-            cmd = click_command.get_command(ctx, cmd_name)
-            node_data["subcommands"].append(
-                build_help_data(cmd, ctx)
+        if is_internal_command(cmd):
+            logger.debug(
+                "helptree: skipping internal %s command", cmd.name
             )
+            continue
+
+        if is_group(cmd):
+            groups.append((cmd_name, cmd))
+        else:
+            commands.append((cmd_name, cmd))
+
+    commands.sort(key=lambda pair: pair[0])
+    groups.sort(key=lambda pair: pair[0])
+    return commands + groups
+
+def build_help_data(
+        click_command: click.Command,
+        ctx: click.Context,
+        version: str = None,
+        _memo: Optional[Dict[Any, Tuple[click.Command, Dict[str, Any]]]] = None,
+        _keys: Optional[_MemoKeys] = None
+        ) -> Dict[str, Any]:
+    """
+    Recursively builds a dictionary for JSON export, utilizing _get_param_data.
+    A command mounted under several parents is extracted once (see _memo_key), and the
+    same dictionary is referenced at each mount point (see dedupe_help_data for JSON).
+    """
+    if _memo is None:
+        _memo = {}
+    if _keys is None:
+        _keys = _MemoKeys()
 
-        # Sub-apps second
-        for cmd_name in group_names:
-            cmd = click_command.get_command(ctx, cmd_name)
+    node_data = _build_node_data(click_command, version)
+    # Recorded before recursing; the command is kept so ids in keys stay unique during the walk
+    _memo[_memo_key(click_command, _keys)] = (click_command, node_data)
+
+    if is_group(click_command):
+        # Commands first, sub-apps second
+        for _cmd_name, cmd in _resolve_children(click_command, ctx):
+            cached = _memo.get(_memo_key(cmd, _keys))
             node_data["subcommands"].append(
-                build_help_data(cmd, ctx)
+                cached[1] if cached is not None else build_help_data(cmd, ctx, _memo=_memo, _keys=_keys)
             )
 
     return node_data
 
+def dedupe_help_data(
+        node_data: Dict[str, Any],
+        _path: Tuple[str, ...] = (),
+        _seen: Optional[Dict[int, str]] = None
+        ) -> Dict[str, Any]:
+    """
+    Returns the reference form of a help model, for JSON export.
+    The first occurrence of a shared subtree is kept in full; each repeat becomes
+    {"name": ..., "$ref": "<dotted path of the first occurrence>"}, where the root path is "".
+    The input is not modified. See expand_help_data_refs for the inverse.
+    """
+    if _seen is None:
+        _seen = {}
+    if id(node_data) in _seen:
+        return {"name": node_data.get("name"), "$ref": _seen[id(node_data)]}
+
+    path = _path + (node_data.get("name") or "app",)
+    _seen[id(node_data)] = ".".join(path[1:])
+
+    deduped = dict(node_data)
+    deduped["subcommands"] = [
+        dedupe_help_data(sub_data, path, _seen) for sub_data in node_data.get("subcommands") or []
+    ]
+    return deduped
+
+def expand_help_data_refs(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Resolves "$ref" nodes (see dedupe_help_data) in place, so repeats share the referenced dictionary."""
+    by_path: Dict[str, Dict[str, Any]] = {}
+    refs: List[Tuple[List[Dict[str, Any]], int, str]] = []
+
+    def collect(node_data: Dict[str, Any], path: Tuple[str, ...]) -> None:
+        by_path[".".join(path[1:])] = node_data
+        for i, sub_data in enumerate(node_data.get("subcommands") or []):
+            if "$ref" in sub_data:
+                refs.append((node_data["subcommands"], i, sub_data["$ref"]))
+            else:
+                collect(sub_data, path + (sub_data.get("name") or "app",))
+
+    collect(data, (data.get("name") or "app",))
+    for subcommands, i, ref in refs:
+        subcommands[i] = by_path[ref]
+    return data
+
+def render_help_tree(node_data: Dict[str, Any], tree_node: Tree) -> None:
+    """
+    Builds the Rich Tree structure from an already-extracted help model (see build_help_data).
+    Nothing is resolved from Click here, so a model built once can be rendered repeatedly.
+    """
+    parameters = node_data.get("parameters") or []
+    if parameters:
+        params_branch = tree_node.add("[yellow]Parameters[/yellow]")
+        for param_data in parameters:
+            params_branch.add(_format_param_data_label(param_data))
+
+    # build_help_data already orders commands first, sub-apps second
+    for sub_data in node_data.get("subcommands") or []:
+        raw_help = sub_data.get("help") or ""
+        full_description = raw_help.splitlines()[0].strip() if raw_help else "No description available."
+
+        if sub_data.get("kind") == "error":
+            # Placeholder for a branch that failed to extract (see isolate.py)
+            label = f"[bold red]{sub_data['name']}[/bold red] [dim](error)[/dim] - [red]{sub_data.get('error', '')}[/red]"
+        elif sub_data.get("is_group"):
+            label = f"[bold cyan]{sub_data['name']}[/bold cyan] [dim](app)[/dim] - [dim]{full_description}[/dim]"
+        else:
+            label = f"[bold white]{sub_data['name']}[/bold white] - [dim]{full_description}[/dim]"
+
+        render_help_tree(sub_data, tree_node.add(label))
+
+def walk_help_data(
+        node_data: Dict[str, Any],
+        path: Tuple[str, ...] = ()
+        ) -> Iterator[Tuple[Tuple[str, ...], Dict[str, Any]]]:
+    """
+    Yields (path, node_data) for every node of a help model, depth-first, in model order.
+    The root path is (root name,). Nothing is copied; one pass, constant extra memory per level.
+    """
+    path = path + (node_data.get("name") or "app",)
+    yield path, node_data
+    for sub_data in node_data.get("subcommands") or []:
+        yield from walk_help_data(sub_data, path)
+
 def is_group(cmd)->bool:
     return callable(getattr(cmd, "list_commands", None))
 
+def is_internal_command(cmd) -> bool:
+    """True for commands typer-helptree adds itself: `helptree`, and the marked `serve` command."""
+    if cmd.name == "helptree":
+        return True
+    callback = getattr(cmd, "callback", None)
+    # Typer wraps the callback; functools.update_wrapper copies the marker, __wrapped__ covers other wrappers
+    return bool(
+        getattr(callback, INTERNAL_COMMAND_MARKER, False)
+        or getattr(getattr(callback, "__wrapped__", None), INTERNAL_COMMAND_MARKER, False)
+    )
+
 def make_context(cmd,parent=None):
     return type(cmd).context_class(cmd, parent=parent)
 
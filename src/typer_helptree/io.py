@@ -134,6 +134,25 @@ def export_help_svg(
         error_logger.error(f"SVG export failed: {e}", exc_info=True)
         raise RuntimeError(f"SVG export failed: {e}")
 
+# --- In-memory Rendering ---
+
+def render_help_txt(app_tree) -> str:
+    """Renders a Rich tree as plain text, without colors, for TXT output."""
+    from rich.console import Console
+    # Capture the Rich tree as plain text using a dummy console
+    capture_console = Console(width=200, force_terminal=False, color_system=None)
+    with capture_console.capture() as capture:
+        capture_console.print(app_tree)
+    return capture.get()
+
+def render_help_svg(app_tree, app_name: str) -> str:
+    """Renders a Rich tree as an SVG document string, without printing to the terminal."""
+    from io import StringIO
+    from rich.console import Console
+    recording_console = Console(record=True, width=120, file=StringIO())
+    recording_console.print(app_tree)
+    return recording_console.export_svg(title=f"{app_name} CLI Help Tree")
+
 # --- Helpers --- 
 
 def get_default_output_dir(use_assets: bool = False) -> Path:
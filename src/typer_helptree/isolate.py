@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/typer_helptree/isolate.py
+"""
+Subprocess-isolated extraction.
+
+```bash
+yourtyperapp helptree --isolated --timeout 10 --memory-limit 1024 --export-json
+```
+
+Each top-level sub-app (and top-level command) is resolved in its own worker
+process, at most `max_workers` at a time. A worker that exceeds the per-task
+timeout is terminated; a worker that exceeds the memory limit fails inside its
+own process. Either way the branch appears in the model as an error placeholder
+(`"kind": "error"`) and the rest of the export carries on.
+
+Workers are forked, so they inherit the already-loaded root app and need no
+import path. Where fork is unavailable (Windows), extraction falls back to the
+in-process build_help_data with a warning.
+"""
+from __future__ import annotations
+import json
+import logging
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import wait
+from typing import Any, Dict, List, Optional, Tuple
+
+import click
+
+from .helptree import _build_node_data, build_help_data, is_group, is_internal_command
+from .io import UniversalEncoder
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 30.0
+
+def _error_node(name: str, reason: str) -> Dict[str, Any]:
+    """Placeholder for a branch that could not be extracted."""
+    return {
+        "name": name,
+        "help": f"Extraction failed: {reason}",
+        "kind": "error",
+        "is_group": False,
+        "parameters": [],
+        "subcommands": [],
+        "error": reason,
+    }
+
+def _apply_memory_limit(memory_limit_mb: Optional[int]) -> None:
+    if not memory_limit_mb:
+        return
+    try:
+        import resource
+    except ImportError:
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+def _worker(conn, click_command: click.Command, ctx: click.Context, cmd_name: str, memory_limit_mb: Optional[int]) -> None:
+    """Runs in the forked child: resolves one child of the root and sends back its serialized subtree."""
+    try:
+        _apply_memory_limit(memory_limit_mb)
+        cmd = click_command.get_command(ctx, cmd_name)
+        if cmd is None or is_internal_command(cmd):
+            conn.send(("skip", False, None))
+            return
+        data = build_help_data(cmd, ctx)
+        conn.send(("ok", is_group(cmd), json.dumps(data, cls=UniversalEncoder)))
+    except MemoryError:
+        conn.send(("error", False, f"memory limit of {memory_limit_mb} MB exceeded"))
+    except BaseException as e:
+        conn.send(("error", False, f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+def build_help_data_isolated(
+        click_command: click.Command,
+        ctx: click.Context,
+        version: str = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        memory_limit_mb: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        ) -> Dict[str, Any]:
+    """
+    Same model as build_help_data, but each top-level child is extracted in a worker process.
+    `memory_limit_mb` caps the address space of each worker (Unix only).
+    """
+    if "fork" not in multiprocessing.get_all_start_methods():
+        logger.warning("helptree: isolated extraction needs the fork start method; extracting in-process")
+        return build_help_data(click_command, ctx, version=version)
+
+    node_data = _build_node_data(click_command, version)
+    if not is_group(click_command):
+        return node_data
+
+    mp_context = multiprocessing.get_context("fork")
+    max_workers = max_workers or os.cpu_count() or 1
+    pending = list(click_command.list_commands(ctx))
+    running: Dict[Any, Tuple[str, Any, float]] = {}  # conn -> (name, process, deadline)
+
+    commands: List[Tuple[str, Dict[str, Any]]] = []
+    groups: List[Tuple[str, Dict[str, Any]]] = []
+
+    def finish(conn, result: Optional[Dict[str, Any]], result_is_group: bool) -> None:
+        cmd_name, process, _deadline = running.pop(conn)
+        conn.close()
+        process.join(timeout=1)
+        if process.is_alive():
+            process.kill()
+            process.join()
+        if result is None:
+            return
+        # Failed branches are listed with the sub-apps, where most isolation failures originate
+        (groups if result_is_group or result.get("kind") == "error" else commands).append((cmd_name, result))
+
+    while pending or running:
+        while pending and len(running) < max_workers:
+            cmd_name = pending.pop(0)
+            recv_conn, send_conn = mp_context.Pipe(duplex=False)
+            process = mp_context.Process(
+                target=_worker,
+                args=(send_conn, click_command, ctx, cmd_name, memory_limit_mb),
+                daemon=True,
+            )
+            process.start()
+            send_conn.close()
+            running[recv_conn] = (cmd_name, process, time.monotonic() + timeout)
+
+        next_deadline = min(deadline for _name, _process, deadline in running.values())
+        for conn in wait(list(running), timeout=max(0.0, next_deadline - time.monotonic())):
+            cmd_name = running[conn][0]
+            try:
+                status, result_is_group, payload = conn.recv()
+            except EOFError:
+                exitcode = running[conn][1].exitcode
+                logger.warning("helptree: worker for %s exited without a result (exit code %s)", cmd_name, exitcode)
+                finish(conn, _error_node(cmd_name, f"worker exited without a result (exit code {exitcode})"), False)
+                continue
+
+            if status == "ok":
+                finish(conn, json.loads(payload), result_is_group)
+            elif status == "skip":
+                finish(conn, None, False)
+            else:
+                logger.warning("helptree: extraction of %s failed: %s", cmd_name, payload)
+                finish(conn, _error_node(cmd_name, payload), False)
+
+        now = time.monotonic()
+        for conn, (cmd_name, process, deadline) in list(running.items()):
+            if deadline <= now:
+                logger.warning("helptree: extraction of %s timed out after %ss", cmd_name, timeout)
+                process.terminate()
+                finish(conn, _error_node(cmd_name, f"timed out after {timeout}s"), False)
+
+    # Stable ordering, as build_help_data: commands first, sub-apps second
+    commands.sort(key=lambda pair: pair[0])
+    groups.sort(key=lambda pair: pair[0])
+    node_data["subcommands"] = [result for _name, result in commands + groups]
+    return node_data
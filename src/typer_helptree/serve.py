@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# src/typer_helptree/serve.py
+"""
+Serve the help tree of a CLI over a small local HTTP server. Standard library only.
+
+```bash
+typer-helptree serve --port 8765
+curl -i http://127.0.0.1:8765/tree.json
+```
+
+The model is built once. Each rendering (JSON, TXT, SVG) is produced on first
+request and then held in memory. ETags are derived from the model fingerprint,
+so a conditional GET is answered with 304 before anything is rendered.
+"""
+from __future__ import annotations
+import hashlib
+import json
+import logging
+import sys
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Callable
+
+from .io import UniversalEncoder, render_help_txt, render_help_svg
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# format -> content type
+CONTENT_TYPES = {
+    "json": "application/json; charset=utf-8",
+    "txt": "text/plain; charset=utf-8",
+    "svg": "image/svg+xml; charset=utf-8",
+}
+
+# request path -> format
+ROUTES = {
+    "/": "json",
+    "/tree.json": "json",
+    "/tree.txt": "txt",
+    "/tree.svg": "svg",
+}
+
+def model_fingerprint(data: Dict[str, Any]) -> str:
+    """Returns a stable hash of the help model, independent of key order."""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), cls=UniversalEncoder)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:32]
+
+class HelpTreeRenderCache:
+    """
+    Holds one built help model and renders each output format at most once.
+    Safe to share between the threads of a ThreadingHTTPServer.
+    """
+    def __init__(self, data: Dict[str, Any], app_name: str, version: str):
+        self.data = data
+        self.app_name = app_name
+        self.version = version
+        self.fingerprint = model_fingerprint(data)
+        self.render_count = 0
+        self._renders: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def etag(self, fmt: str) -> str:
+        return f'"{self.fingerprint}-{fmt}"'
+
+    def get(self, fmt: str) -> bytes:
+        """Returns the rendered bytes for a format, rendering on first use only."""
+        with self._lock:
+            if fmt not in self._renders:
+                self._renders[fmt] = self._render(fmt).encode("utf-8")
+                self.render_count += 1
+            return self._renders[fmt]
+
+    def _render(self, fmt: str) -> str:
+        if fmt == "json":
+            return json.dumps(self.data, indent=4, cls=UniversalEncoder)
+
+        from rich.tree import Tree
+        from .helptree import render_help_tree
+        app_tree = Tree(f"[bold blue]{self.app_name}[/bold blue] (v{self.version})", guide_style="cyan")
+        render_help_tree(self.data, app_tree)
+
+        if fmt == "txt":
+            return render_help_txt(app_tree)
+        if fmt == "svg":
+            return render_help_svg(app_tree, self.app_name)
+        raise ValueError(f"Unsupported format: {fmt}")
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Evaluates an If-None-Match header value against an ETag (weak comparison)."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+def make_handler(cache: HelpTreeRenderCache) -> Callable[..., BaseHTTPRequestHandler]:
+    """Builds a request handler class bound to a render cache."""
+
+    class HelpTreeRequestHandler(BaseHTTPRequestHandler):
+        server_version = "typer-helptree"
+
+        def do_GET(self):
+            self._respond(send_body=True)
+
+        def do_HEAD(self):
+            self._respond(send_body=False)
+
+        def _respond(self, send_body: bool):
+            path = self.path.split("?", 1)[0]
+            fmt = ROUTES.get(path)
+            if fmt is None:
+                self.send_error(HTTPStatus.NOT_FOUND, f"Try one of: {', '.join(sorted(ROUTES))}")
+                return
+
+            etag = cache.etag(fmt)
+            if_none_match = self.headers.get("If-None-Match")
+            if if_none_match and _etag_matches(if_none_match, etag):
+                # Answered from the fingerprint alone; nothing is rendered
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+
+            body = cache.get(fmt)
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", CONTENT_TYPES[fmt])
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            if send_body:
+                self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.info("%s - %s", self.address_string(), format % args)
+
+    return HelpTreeRequestHandler
+
+def make_server(
+        cache: HelpTreeRenderCache,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT
+        ) -> ThreadingHTTPServer:
+    """Creates (but does not start) the HTTP server. Use port=0 for an ephemeral port."""
+    return ThreadingHTTPServer((host, port), make_handler(cache))
+
+def serve_help_tree(
+        data: Dict[str, Any],
+        app_name: str,
+        version: str,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT
+        ) -> None:
+    """Serves the help model until interrupted."""
+    cache = HelpTreeRenderCache(data, app_name, version)
+    httpd = make_server(cache, host, port)
+    bound_host, bound_port = httpd.server_address[:2]
+    logger.debug("helptree: serving fingerprint=%s", cache.fingerprint)
+    print(f"Serving {app_name} help tree on http://{bound_host}:{bound_port}/ (Ctrl+C to stop)", file=sys.stderr)
+    for route in sorted(ROUTES):
+        if route != "/":
+            print(f"  http://{bound_host}:{bound_port}{route}", file=sys.stderr)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()